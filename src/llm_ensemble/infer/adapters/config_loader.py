@@ -4,6 +4,7 @@ Loads YAML model configuration files and returns ModelConfig domain objects.
 """
 
 from __future__ import annotations
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -63,6 +64,16 @@ def load_model_config(
             + "\n".join(f"  - {p.stem}" for p in config_dir.glob("*.yaml"))
         )
 
+    # Cached on (path, mtime): repeated loads (test suites, batch harnesses)
+    # skip the YAML parse, while edits to the file still invalidate
+    return _load_model_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_model_config_cached(config_path_str: str, mtime_ns: int) -> ModelConfig:
+    """Parse and validate a model config YAML file (memoized)."""
+    config_path = Path(config_path_str)
+
     # Load YAML
     with open(config_path, "r", encoding="utf-8") as f:
         data = yaml.safe_load(f)
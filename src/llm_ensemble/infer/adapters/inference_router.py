@@ -4,27 +4,33 @@ Routes inference requests based on model config provider field.
 """
 
 from __future__ import annotations
+import asyncio
+import itertools
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
 from llm_ensemble.ingest.domain.models import JudgingExample
 from llm_ensemble.infer.domain.models import ModelConfig, ModelJudgement
-from llm_ensemble.infer.adapters.openrouter import send_inference_request
+from llm_ensemble.infer.adapters.openrouter import OpenRouterJudge
 
 
 def iter_judgements(
-    examples: Iterator[JudgingExample],
+    examples: Iterable[JudgingExample],
     model_config: ModelConfig,
     prompts_dir: Optional[Path] = None,
     prompt_template_name: str = "thomas-et-al-prompt",
+    concurrency: int = 1,
+    use_cache: bool = True,
 ) -> Iterator[ModelJudgement]:
     """Run inference over examples using the appropriate provider adapter.
 
     Args:
-        examples: Iterator of JudgingExample objects
+        examples: Iterable of JudgingExample objects
         model_config: Model configuration with provider and settings
         prompts_dir: Directory containing prompt templates (defaults to configs/prompts)
         prompt_template_name: Name of the prompt template to use (defaults to "thomas-et-al-prompt")
+        concurrency: Number of in-flight requests; 1 means strictly sequential
+        use_cache: Serve repeated identical requests from the on-disk response cache
 
     Yields:
         ModelJudgement objects for each example
@@ -39,8 +45,14 @@ def iter_judgements(
         >>> for judgement in iter_judgements(iter(examples), config):
         ...     print(judgement.label)
     """
+    # Accept any iterable: the wave dispatch below relies on islice
+    # consuming the source, which a bare list or other Sequence would not do
+    examples = iter(examples)
+
     if model_config.provider == "openrouter":
-        yield from _iter_openrouter_judgements(examples, model_config, prompts_dir, prompt_template_name)
+        yield from _iter_openrouter_judgements(
+            examples, model_config, prompts_dir, prompt_template_name, concurrency, use_cache
+        )
     elif model_config.provider == "hf":
         raise NotImplementedError("HuggingFace adapter not yet implemented")
     elif model_config.provider == "ollama":
@@ -54,6 +66,8 @@ def _iter_openrouter_judgements(
     model_config: ModelConfig,
     prompts_dir: Optional[Path] = None,
     prompt_template_name: str = "thomas-et-al-prompt",
+    concurrency: int = 1,
+    use_cache: bool = True,
 ) -> Iterator[ModelJudgement]:
     """Run inference using OpenRouter adapter.
 
@@ -62,6 +76,8 @@ def _iter_openrouter_judgements(
         model_config: Model configuration
         prompts_dir: Directory containing prompt templates (defaults to configs/prompts)
         prompt_template_name: Name of the prompt template to use (defaults to "thomas-et-al-prompt")
+        concurrency: Number of in-flight requests; 1 means strictly sequential
+        use_cache: Serve repeated identical requests from the on-disk response cache
 
     Yields:
         ModelJudgement objects
@@ -75,23 +91,61 @@ def _iter_openrouter_judgements(
             f"but missing openrouter_model_id field"
         )
 
-    # Extract default params
-    temperature = model_config.default_params.get("temperature", 0.0)
-    max_tokens = model_config.default_params.get("max_tokens", 256)
-
-    for example in examples:
-        # Convert JudgingExample to dict for the adapter
-        example_dict = example.model_dump()
-
-        # Send inference request
-        judgement_dict = send_inference_request(
-            example=example_dict,
-            model_id=model_config.openrouter_model_id,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            prompt_template_name=prompt_template_name,
-            prompts_dir=prompts_dir,
-        )
+    # One judge per run: client, prompt config, compiled template,
+    # instruction builder, and parser are all resolved in __init__ so the
+    # per-example path is just build + HTTP + parse
+    openrouter_judge = OpenRouterJudge(
+        model_id=model_config.openrouter_model_id,
+        temperature=model_config.default_params.get("temperature", 0.0),
+        max_tokens=model_config.default_params.get("max_tokens", 256),
+        prompt_template_name=prompt_template_name,
+        prompts_dir=prompts_dir,
+        use_cache=use_cache,
+    )
+
+    if concurrency <= 1:
+        for example in examples:
+            yield ModelJudgement(**openrouter_judge.judge(example))
+        return
+
+    # Concurrent fan-out: the workload is I/O-latency-bound, so overlapping
+    # requests amortizes network round-trips. Dispatch in bounded waves so
+    # judgements still stream to the writer instead of accumulating in RAM.
+    # One event loop spans all waves: the async client's connection pool is
+    # bound to the loop it first runs on, so a loop per wave would tear down
+    # warm connections (and breaks outright on loop-bound SDK transports).
+    wave_size = concurrency * 4
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            wave = list(itertools.islice(examples, wave_size))
+            if not wave:
+                return
+            yield from loop.run_until_complete(
+                _judge_wave(wave, openrouter_judge, concurrency)
+            )
+    finally:
+        loop.close()
+
+
+async def _judge_wave(
+    wave: list[JudgingExample],
+    openrouter_judge: OpenRouterJudge,
+    concurrency: int,
+) -> list[ModelJudgement]:
+    """Judge a wave of examples with at most `concurrency` in flight.
+
+    Requests run natively on the judge's shared async client (one keep-alive
+    connection pool, no worker threads); results are collected in arrival
+    order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def judge_one(example: JudgingExample) -> ModelJudgement:
+        async with semaphore:
+            return ModelJudgement(**await openrouter_judge.ajudge(example))
 
-        # Convert dict to ModelJudgement object
-        yield ModelJudgement(**judgement_dict)
+    results: list[ModelJudgement] = []
+    for completed in asyncio.as_completed([judge_one(ex) for ex in wave]):
+        results.append(await completed)
+    return results
@@ -5,19 +5,339 @@ to ModelJudgement domain objects.
 """
 
 from __future__ import annotations
+import functools
 import os
 import time
 from pathlib import Path
 from typing import Optional, Any
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from llm_ensemble.infer.domain.prompt_builder import build_instruction_from_judging_example
-from llm_ensemble.infer.domain.response_parser import parse_thomas_response
+from llm_ensemble.ingest.domain.models import JudgingExample
+from llm_ensemble.infer.domain.prompt_builder import make_query_instruction_builder
+from llm_ensemble.infer.domain.response_parser import load_parser, parse_thomas_response
 from llm_ensemble.infer.adapters.prompt_loader import load_prompt_template, load_prompt_config
+from llm_ensemble.infer.adapters.response_cache import load_cached_response, store_cached_response
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# Retry budget for transient failures (429 rate limits, 5xx). The OpenAI SDK
+# retries these with exponential backoff inside the same HTTP session.
+DEFAULT_MAX_RETRIES = 3
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: str, timeout: int) -> OpenAI:
+    """Return a shared OpenAI client configured for OpenRouter.
+
+    Caching the client preserves its underlying HTTP connection pool across
+    requests, so repeated calls reuse warm TCP+TLS connections instead of
+    paying a fresh handshake per example.
+
+    Args:
+        api_key: OpenRouter API key
+        timeout: Request timeout in seconds
+
+    Returns:
+        OpenAI client instance (one per distinct api_key/timeout pair)
+    """
+    return OpenAI(
+        api_key=api_key,
+        base_url=OPENROUTER_BASE_URL,
+        timeout=timeout,
+        max_retries=DEFAULT_MAX_RETRIES,
+    )
+
+
+class OpenRouterJudge:
+    """Judges examples via OpenRouter with all one-time setup done up front.
+
+    __init__ resolves the API key, client, prompt config, compiled template,
+    instruction builder, and response parser once; judge() then only builds
+    the instruction, makes the HTTP call, and parses the response. Create
+    one instance per run and reuse it for every example.
+
+    Example:
+        >>> judge = OpenRouterJudge("qwen/qwen-0.5b-chat")
+        >>> judgement = judge.judge(example)
+        >>> judgement["label"]  # 0, 1, or 2
+        2
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        api_key: Optional[str] = None,
+        temperature: float = 0.0,
+        max_tokens: int = 256,
+        timeout: int = 30,
+        prompt_template_name: str = "thomas-et-al-prompt",
+        prompts_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        early_stop: bool = False,
+    ):
+        """Resolve all per-run state for judging with one model/prompt pair.
+
+        Args:
+            model_id: OpenRouter model ID (e.g., "qwen/qwen-0.5b-chat")
+            api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
+            temperature: Sampling temperature (default: 0.0 for deterministic)
+            max_tokens: Maximum tokens to generate
+            timeout: Request timeout in seconds
+            prompt_template_name: Name of the prompt template to use
+            prompts_dir: Directory containing prompt templates (defaults to
+                configs/prompts)
+            use_cache: Serve identical requests from the on-disk response
+                cache instead of re-calling the provider. Only effective at
+                temperature 0; sampled responses are never cached.
+            early_stop: Stream the response and close it as soon as a
+                verdict parses, skipping any trailing rationale tokens.
+                Off by default so cached raw_text stays complete.
+
+        Raises:
+            ValueError: If API key is not provided and not in environment
+        """
+        if api_key is None:
+            api_key = os.getenv("OPENROUTER_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "OpenRouter API key required. Set OPENROUTER_API_KEY env var "
+                "or pass api_key parameter."
+            )
+
+        self.model_id = model_id
+        self._client = _get_client(api_key, timeout)
+        # Deliberately not shared across judges: an AsyncOpenAI transport
+        # binds to the event loop it first runs on, so reusing one across
+        # runs (each with its own loop) breaks. Within a run, all in-flight
+        # tasks still share this client's keep-alive connection pool.
+        self._async_client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=OPENROUTER_BASE_URL,
+            timeout=timeout,
+            max_retries=DEFAULT_MAX_RETRIES,
+        )
+        self._temperature = temperature
+        self._max_tokens = max_tokens
+        # Sampling at temperature > 0 is nondeterministic by design;
+        # replaying a cached draw would silently pin every run to the first
+        # sample, so the cache only engages for deterministic requests
+        self._use_cache = use_cache and temperature == 0.0
+        self._early_stop = early_stop
+
+        prompt_config = load_prompt_config(prompt_template_name, prompts_dir)
+        template = load_prompt_template(prompt_config.template_file, prompts_dir)
+        variables = prompt_config.variables
+
+        def build_instruction(example: JudgingExample) -> str:
+            # The same query is judged against many documents, so the
+            # memoized per-query builder renders the boilerplate once and
+            # assembles repeat instructions by string concatenation
+            return make_query_instruction_builder(
+                template, example.query_text, **variables
+            )(example.doc)
+
+        self._build_instruction = build_instruction
+        if prompt_config.response_parser:
+            self._parser = load_parser(prompt_config.response_parser)
+        else:
+            self._parser = parse_thomas_response
+
+    def judge(self, example: JudgingExample) -> dict[str, Any]:
+        """Judge one example and return a ModelJudgement dict.
+
+        Args:
+            example: JudgingExample to judge (fields read via attribute access)
+
+        Returns:
+            Dict matching ModelJudgement schema with all required fields
+
+        Raises:
+            Exception: If the API request fails
+        """
+        instruction = self._build_instruction(example)
+        start_time = time.perf_counter_ns()
+
+        # Serve from the on-disk response cache when an identical request was
+        # already paid for (e.g., re-runs while iterating on parsers/prompts)
+        cached = (
+            load_cached_response(
+                self.model_id, instruction, self._temperature, self._max_tokens
+            )
+            if self._use_cache else None
+        )
+        if cached is not None:
+            raw_text = cached["raw_text"]
+            model_version = cached.get("version")
+        elif self._early_stop:
+            raw_text, model_version, truncated = self._stream_until_verdict(instruction)
+            # Never cache a stream we aborted early: the truncated raw_text
+            # would be indistinguishable from a complete response on replay
+            if self._use_cache and not truncated:
+                store_cached_response(
+                    self.model_id, instruction, self._temperature,
+                    self._max_tokens, raw_text, model_version,
+                )
+        else:
+            response = self._client.chat.completions.create(
+                model=self.model_id,
+                messages=[{"role": "user", "content": instruction}],
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+            )
+            raw_text, model_version = self._extract_response(response)
+            if self._use_cache:
+                store_cached_response(
+                    self.model_id, instruction, self._temperature,
+                    self._max_tokens, raw_text, model_version,
+                )
+
+        return self._finish(example, raw_text, model_version, start_time)
+
+    def _stream_until_verdict(self, instruction: str) -> tuple[str, Optional[str], bool]:
+        """Stream a completion and close it once a verdict parses.
+
+        Models that append rationale after the JSON object waste generation
+        time on tokens the parser never reads; checking the accumulated text
+        whenever a chunk closes a brace lets us abort the stream at the
+        verdict. Returns the raw text, the model version, and whether the
+        stream was aborted before the model finished (truncated text).
+        """
+        parts: list[str] = []
+        model_version = None
+        truncated = False
+        stream = self._client.chat.completions.create(
+            model=self.model_id,
+            messages=[{"role": "user", "content": instruction}],
+            temperature=self._temperature,
+            max_tokens=self._max_tokens,
+            stream=True,
+        )
+        with stream:
+            for chunk in stream:
+                if model_version is None:
+                    model_version = getattr(chunk, "model", None)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                # Only re-parse when a brace closes; cheap containment check
+                # keeps the common mid-object chunks at O(len(delta))
+                if "}" in delta:
+                    label, _ = self._parser("".join(parts))
+                    if label is not None:
+                        truncated = True
+                        break
+        return "".join(parts), model_version, truncated
+
+    async def ajudge(self, example: JudgingExample) -> dict[str, Any]:
+        """Async variant of judge() for bounded-concurrency fan-out.
+
+        Uses the shared AsyncOpenAI client so all in-flight tasks reuse one
+        keep-alive connection pool; cache, parsing, and output shape are
+        identical to judge().
+
+        Args:
+            example: JudgingExample to judge
+
+        Returns:
+            Dict matching ModelJudgement schema with all required fields
+        """
+        instruction = self._build_instruction(example)
+        start_time = time.perf_counter_ns()
+
+        cached = (
+            load_cached_response(
+                self.model_id, instruction, self._temperature, self._max_tokens
+            )
+            if self._use_cache else None
+        )
+        if cached is not None:
+            raw_text = cached["raw_text"]
+            model_version = cached.get("version")
+        else:
+            response = await self._async_client.chat.completions.create(
+                model=self.model_id,
+                messages=[{"role": "user", "content": instruction}],
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+            )
+            raw_text, model_version = self._extract_response(response)
+            if self._use_cache:
+                store_cached_response(
+                    self.model_id, instruction, self._temperature,
+                    self._max_tokens, raw_text, model_version,
+                )
+
+        return self._finish(example, raw_text, model_version, start_time)
+
+    @staticmethod
+    def _extract_response(response: Any) -> tuple[str, Optional[str]]:
+        """Pull raw text and model version out of a completions response."""
+        raw_text = response.choices[0].message.content
+        # Single C-level lookup; hasattr would do the same lookup twice
+        model_version = getattr(response, "model", None)
+        return raw_text, model_version
+
+    def _finish(
+        self,
+        example: JudgingExample,
+        raw_text: str,
+        model_version: Optional[str],
+        start_time: float,
+    ) -> dict[str, Any]:
+        """Parse the raw response and assemble the ModelJudgement dict."""
+        latency_ms = (time.perf_counter_ns() - start_time) / 1e6
+
+        # Parse the model output
+        label, warnings = self._parser(raw_text)
+
+        # Build ModelJudgement dict
+        return {
+            "model_id": self.model_id,
+            "provider": "openrouter",
+            "version": model_version,
+            "query_id": example.query_id,
+            "docid": example.docid,
+            "label": label,  # None if parsing failed
+            "score": float(label) if label is not None else None,  # 0, 1, or 2 (or None)
+            "confidence": None,  # Not provided by this template
+            "rationale": None,  # Template doesn't request rationale
+            "raw_text": raw_text,
+            "latency_ms": latency_ms,
+            "retries": 0,
+            "cost_estimate": None,  # Could be added later
+            "warnings": warnings,
+        }
+
+
+@functools.lru_cache(maxsize=8)
+def _get_judge(
+    model_id: str,
+    api_key: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    prompt_template_name: str,
+    prompts_dir: Optional[str],
+    use_cache: bool,
+) -> OpenRouterJudge:
+    """Memoize OpenRouterJudge instances for the function-style entry point."""
+    return OpenRouterJudge(
+        model_id=model_id,
+        api_key=api_key,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        prompt_template_name=prompt_template_name,
+        prompts_dir=Path(prompts_dir) if prompts_dir else None,
+        use_cache=use_cache,
+    )
 
 
 def send_inference_request(
-    example: dict,
+    example: JudgingExample,
     model_id: str,
     api_key: Optional[str] = None,
     temperature: float = 0.0,
@@ -25,11 +345,17 @@ def send_inference_request(
     timeout: int = 30,
     prompt_template_name: str = "thomas-et-al-prompt",
     prompts_dir: Optional[Path] = None,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Send an inference request to OpenRouter and return a ModelJudgement dict.
 
+    Thin wrapper over OpenRouterJudge for one-off calls; the judge instance
+    (client, prompt config, template, parser) is cached per argument set, so
+    repeated calls don't redo the setup. Loops should construct an
+    OpenRouterJudge directly.
+
     Args:
-        example: JudgingExample dict with query_text, doc, query_id, docid
+        example: JudgingExample to judge (fields read via attribute access)
         model_id: OpenRouter model ID (e.g., "qwen/qwen-0.5b-chat")
         api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
         temperature: Sampling temperature (default: 0.0 for deterministic)
@@ -37,6 +363,8 @@ def send_inference_request(
         timeout: Request timeout in seconds
         prompt_template_name: Name of the prompt template to use (defaults to "thomas-et-al-prompt")
         prompts_dir: Directory containing prompt templates (defaults to configs/prompts)
+        use_cache: Serve identical (model, instruction) requests from the
+            on-disk response cache instead of re-calling the provider
 
     Returns:
         Dict matching ModelJudgement schema with all required fields
@@ -46,81 +374,23 @@ def send_inference_request(
         Exception: If the API request fails
 
     Example:
-        >>> example = {
-        ...     "query_text": "python tutorial",
-        ...     "doc": "Learn Python...",
-        ...     "query_id": "q1",
-        ...     "docid": "d1"
-        ... }
+        >>> example = JudgingExample(
+        ...     dataset="llm-judge-2024",
+        ...     query_id="q1", query_text="python tutorial",
+        ...     docid="d1", doc="Learn Python...",
+        ... )
         >>> result = send_inference_request(example, "qwen/qwen-0.5b-chat")
         >>> result["label"]  # 0, 1, or 2
         2
     """
-    # Get API key
-    if api_key is None:
-        api_key = os.getenv("OPENROUTER_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "OpenRouter API key required. Set OPENROUTER_API_KEY env var "
-            "or pass api_key parameter."
-        )
-
-    # Load prompt config and template
-    prompt_config = load_prompt_config(prompt_template_name, prompts_dir)
-    template = load_prompt_template(prompt_config.template_file, prompts_dir)
-
-    # Build instruction using variables from config
-    instruction = build_instruction_from_judging_example(
-        template=template,
-        example=example,
-        **prompt_config.variables  # Unpack variables from config
-    )
-
-    # Initialize OpenAI client configured for OpenRouter
-    client = OpenAI(
-        api_key=api_key,
-        base_url="https://openrouter.ai/api/v1",
-        timeout=timeout,
+    judge = _get_judge(
+        model_id,
+        api_key,
+        temperature,
+        max_tokens,
+        timeout,
+        prompt_template_name,
+        str(prompts_dir) if prompts_dir else None,
+        use_cache,
     )
-
-    # Track timing
-    warnings = []
-    start_time = time.time()
-
-    # Send request
-    response = client.chat.completions.create(
-        model=model_id,
-        messages=[{"role": "user", "content": instruction}],
-        temperature=temperature,
-        max_tokens=max_tokens,
-    )
-
-    latency_ms = (time.time() - start_time) * 1000
-
-    # Extract response
-    raw_text = response.choices[0].message.content
-
-    # Parse the model output
-    label, parse_warnings = parse_thomas_response(raw_text)
-    warnings.extend(parse_warnings)
-
-    # Extract model version if available
-    model_version = response.model if hasattr(response, "model") else None
-
-    # Build ModelJudgement dict
-    return {
-        "model_id": model_id,
-        "provider": "openrouter",
-        "version": model_version,
-        "query_id": example["query_id"],
-        "docid": example["docid"],
-        "label": label,  # None if parsing failed
-        "score": float(label) if label is not None else None,  # 0, 1, or 2 (or None)
-        "confidence": None,  # Not provided by this template
-        "rationale": None,  # Template doesn't request rationale
-        "raw_text": raw_text,
-        "latency_ms": latency_ms,
-        "retries": 0,
-        "cost_estimate": None,  # Could be added later
-        "warnings": warnings,
-    }
+    return judge.judge(example)
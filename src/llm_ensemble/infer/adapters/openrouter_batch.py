@@ -0,0 +1,226 @@
+"""OpenRouter Batch API adapter for offline inference runs.
+
+For bulk judging runs that don't need results interactively, the Batch
+API trades latency for cost: requests are uploaded as one JSONL file,
+processed asynchronously on the provider side (at a discount and outside
+per-request rate limits), and collected when the job finishes.
+
+Reuses the same instruction builders and response parsers as the
+synchronous adapter so batch and interactive results are identical.
+"""
+
+from __future__ import annotations
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from llm_ensemble.ingest.domain.models import JudgingExample
+from llm_ensemble.infer.domain.response_parser import load_parser, parse_thomas_response
+from llm_ensemble.infer.domain.prompt_builder import make_instruction_builder
+from llm_ensemble.infer.adapters.openrouter import _get_client
+from llm_ensemble.infer.adapters.prompt_loader import load_prompt_config, load_prompt_template
+
+# How long the provider is allowed to take before the job expires
+_COMPLETION_WINDOW = "24h"
+
+# Statuses after which a batch job will never make further progress
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """Resolve the OpenRouter API key from the argument or environment."""
+    if api_key is None:
+        api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "OpenRouter API key required. Set OPENROUTER_API_KEY env var "
+            "or pass api_key parameter."
+        )
+    return api_key
+
+
+def submit_batch(
+    examples: Iterable[JudgingExample],
+    model_id: str,
+    api_key: Optional[str] = None,
+    temperature: float = 0.0,
+    max_tokens: int = 256,
+    timeout: int = 30,
+    prompt_template_name: str = "thomas-et-al-prompt",
+    prompts_dir: Optional[Path] = None,
+) -> str:
+    """Upload a batch of judging requests and start an asynchronous job.
+
+    Args:
+        examples: JudgingExamples to judge
+        model_id: OpenRouter model ID (e.g., "qwen/qwen-0.5b-chat")
+        api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate per response
+        timeout: Per-HTTP-request timeout in seconds (upload/create calls)
+        prompt_template_name: Name of the prompt template to use
+        prompts_dir: Directory containing prompt templates
+
+    Returns:
+        Provider batch job ID, to pass to wait_for_batch/collect_batch
+
+    Raises:
+        ValueError: If the API key is missing
+    """
+    api_key = _resolve_api_key(api_key)
+    client = _get_client(api_key, timeout)
+
+    prompt_config = load_prompt_config(prompt_template_name, prompts_dir)
+    template = load_prompt_template(prompt_config.template_file, prompts_dir)
+    build = make_instruction_builder(template, **prompt_config.variables)
+
+    # Write one chat.completions request per example; custom_id carries the
+    # (query_id, docid) pair through the provider and back
+    fd, tmp_path = tempfile.mkstemp(suffix=".jsonl", prefix="openrouter_batch_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for example in examples:
+                request = {
+                    "custom_id": f"{example.query_id}|{example.docid}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model_id,
+                        "messages": [{"role": "user", "content": build(example)}],
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                    },
+                }
+                f.write(json.dumps(request) + "\n")
+
+        with open(tmp_path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+    finally:
+        os.unlink(tmp_path)
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=_COMPLETION_WINDOW,
+    )
+    return batch.id
+
+
+def wait_for_batch(
+    batch_id: str,
+    api_key: Optional[str] = None,
+    timeout: int = 30,
+    poll_interval: float = 30.0,
+) -> Any:
+    """Block until a batch job reaches a terminal status.
+
+    Args:
+        batch_id: Job ID returned by submit_batch
+        api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
+        timeout: Per-HTTP-request timeout in seconds
+        poll_interval: Seconds to sleep between status polls
+
+    Returns:
+        The final batch object from the provider
+
+    Raises:
+        RuntimeError: If the job ends in any status other than "completed"
+    """
+    api_key = _resolve_api_key(api_key)
+    client = _get_client(api_key, timeout)
+
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _TERMINAL_STATUSES:
+            break
+        time.sleep(poll_interval)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch_id} ended with status: {batch.status}")
+    return batch
+
+
+def collect_batch(
+    batch_id: str,
+    model_id: str,
+    api_key: Optional[str] = None,
+    timeout: int = 30,
+    prompt_template_name: str = "thomas-et-al-prompt",
+    prompts_dir: Optional[Path] = None,
+) -> Iterator[dict[str, Any]]:
+    """Download a completed batch and yield ModelJudgement dicts.
+
+    Responses go through the same parser as the synchronous path, so a
+    batch run and an interactive run over the same examples produce
+    byte-identical judgements (modulo latency/version fields).
+
+    Args:
+        batch_id: Job ID of a completed batch (see wait_for_batch)
+        model_id: OpenRouter model ID the batch was submitted with
+        api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
+        timeout: Per-HTTP-request timeout in seconds
+        prompt_template_name: Prompt template the batch was submitted with
+        prompts_dir: Directory containing prompt templates
+
+    Yields:
+        Dicts matching the ModelJudgement schema, in provider output order
+    """
+    api_key = _resolve_api_key(api_key)
+    client = _get_client(api_key, timeout)
+
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch_id} is not completed (status: {batch.status})")
+
+    prompt_config = load_prompt_config(prompt_template_name, prompts_dir)
+    if prompt_config.response_parser:
+        parser = load_parser(prompt_config.response_parser)
+    else:
+        parser = parse_thomas_response
+
+    output = client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        query_id, docid = record["custom_id"].split("|", 1)
+
+        # Failed requests in an otherwise completed batch carry a null
+        # response (or a body without choices) plus an error object;
+        # surface them like parse failures instead of crashing collection
+        response = record.get("response")
+        response_body = response.get("body") if response else None
+        choices = response_body.get("choices") if response_body else None
+        if choices:
+            raw_text = choices[0]["message"]["content"]
+            label, warnings = parser(raw_text)
+        else:
+            error = record.get("error") or (
+                response_body.get("error") if response_body else None
+            )
+            message = (
+                error.get("message") if isinstance(error, dict) else None
+            ) or str(error)
+            raw_text = ""
+            label = None
+            warnings = [f"Batch request failed: {message}"]
+
+        yield {
+            "model_id": model_id,
+            "provider": "openrouter",
+            "version": response_body.get("model") if response_body else None,
+            "query_id": query_id,
+            "docid": docid,
+            "label": label,
+            "score": float(label) if label is not None else None,
+            "confidence": None,
+            "rationale": None,
+            "raw_text": raw_text,
+            "latency_ms": 0.0,  # Not meaningful for asynchronous batch jobs
+            "retries": 0,
+            "cost_estimate": None,
+            "warnings": warnings,
+        }
@@ -5,17 +5,56 @@ configs/prompts directory. Follows the same pattern as config_loader.py for cons
 """
 
 from __future__ import annotations
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 import yaml
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateNotFound
 
 from llm_ensemble.infer.domain.models import PromptConfig
 
 
+def _get_bytecode_cache_dir() -> Path:
+    """Directory where compiled Jinja template bytecode is persisted.
+
+    Defaults to artifacts/cache/jinja under the project root; override
+    with LLM_ENSEMBLE_JINJA_CACHE_DIR (e.g., a writable volume when the
+    project tree is mounted read-only in a container).
+    """
+    override = os.getenv("LLM_ENSEMBLE_JINJA_CACHE_DIR")
+    if override:
+        return Path(override)
+    project_root = Path(__file__).parents[4]
+    return project_root / "artifacts" / "cache" / "jinja"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_environment(prompts_dir: str) -> Environment:
+    """Get a shared Jinja2 environment for a prompts directory.
+
+    The environment compiles each template once and caches the result, so
+    repeated loads (one per example in the inference loop) are dict lookups
+    instead of file reads + re-compiles. Compiled bytecode is also persisted
+    to disk so fresh processes skip the template parse entirely and just
+    marshal.load the code object.
+    """
+    cache_dir = _get_bytecode_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(prompts_dir),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_prompts_dir() -> Path:
     """Get the default configs/prompts directory.
 
+    The location is invariant for the process lifetime, so it is computed
+    once instead of walking Path.parents on every template/config load.
+
     Returns:
         Path to configs/prompts relative to project root
     """
@@ -62,6 +101,16 @@ def load_prompt_config(
             + "\n".join(f"  - {p.stem}" for p in prompts_dir.glob("*.yaml"))
         )
 
+    # Cached on (path, mtime): repeated loads skip the YAML parse, while
+    # edits to the file still invalidate
+    return _load_prompt_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_config_cached(config_path_str: str, mtime_ns: int) -> PromptConfig:
+    """Parse and validate a prompt config YAML file (memoized)."""
+    config_path = Path(config_path_str)
+
     # Load YAML
     with open(config_path, "r", encoding="utf-8") as f:
         data = yaml.safe_load(f)
@@ -104,16 +153,12 @@ def load_prompt_template(
     if not template_name.endswith(".jinja"):
         template_name = f"{template_name}.jinja"
 
-    # Build path to template file
-    template_path = prompts_dir / template_name
-
-    if not template_path.exists():
+    # Load through the shared environment so compiled templates are cached
+    try:
+        return _get_environment(str(prompts_dir)).get_template(template_name)
+    except TemplateNotFound:
         raise FileNotFoundError(
-            f"Prompt template not found: {template_path}\n"
+            f"Prompt template not found: {prompts_dir / template_name}\n"
             f"Available templates in {prompts_dir}:\n"
             + "\n".join(f"  - {p.stem}" for p in prompts_dir.glob("*.jinja"))
-        )
-
-    # Load template
-    with open(template_path, "r", encoding="utf-8") as f:
-        return Template(f.read())
+        ) from None
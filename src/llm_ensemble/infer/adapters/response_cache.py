@@ -0,0 +1,134 @@
+"""On-disk cache for raw LLM responses.
+
+Keyed by (model_id, instruction, temperature, max_tokens) so repeated runs
+over the same input — typical when iterating on parsers, prompts, or
+aggregation — can skip the expensive LLM call entirely, while changing the
+sampling parameters misses rather than replaying a stale completion. Only
+the raw response text is cached, so parser changes still take effect on
+replay. Callers should not cache at all when temperature > 0: sampled
+responses are nondeterministic by design, and replaying one would silently
+pin every run to the first draw.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+def get_default_cache_dir() -> Path:
+    """Get the default response cache directory.
+
+    Returns:
+        Path to artifacts/cache/responses relative to project root
+    """
+    # Navigate from this file to project root, then to artifacts/cache
+    # This file is at: src/llm_ensemble/infer/adapters/response_cache.py
+    # Project root is 4 levels up
+    project_root = Path(__file__).parents[4]
+    return project_root / "artifacts" / "cache" / "responses"
+
+
+def cache_key(
+    model_id: str,
+    instruction: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Compute a stable cache key for one fully specified request.
+
+    The sampling parameters are part of the key: the same instruction at a
+    different temperature or token budget is a different request, and must
+    not be served the other's cached completion.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model_id.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(instruction.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(f"{temperature!r}|{max_tokens}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_path(cache_dir: Path, key: str) -> Path:
+    # Two-character fan-out keeps directory listings manageable
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def load_cached_response(
+    model_id: str,
+    instruction: str,
+    temperature: float,
+    max_tokens: int,
+    cache_dir: Optional[Path] = None,
+) -> Optional[dict]:
+    """Look up a cached response.
+
+    Args:
+        model_id: Provider model ID the request was sent to
+        instruction: Fully rendered prompt instruction
+        temperature: Sampling temperature the request was made with
+        max_tokens: Token budget the request was made with
+        cache_dir: Cache directory (defaults to artifacts/cache/responses)
+
+    Returns:
+        Dict with "raw_text" and "version" keys, or None on cache miss
+    """
+    if cache_dir is None:
+        cache_dir = get_default_cache_dir()
+
+    path = _cache_path(
+        cache_dir, cache_key(model_id, instruction, temperature, max_tokens)
+    )
+    if not path.exists():
+        return None
+
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        # A corrupt entry (e.g., interrupted write) is treated as a miss
+        return None
+
+
+def store_cached_response(
+    model_id: str,
+    instruction: str,
+    temperature: float,
+    max_tokens: int,
+    raw_text: str,
+    version: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+) -> Path:
+    """Store a response in the cache atomically.
+
+    Writes to a temp file and os.replace()s it into place, so concurrent
+    readers never observe a partially written entry.
+
+    Returns:
+        Path to the written cache entry
+    """
+    if cache_dir is None:
+        cache_dir = get_default_cache_dir()
+
+    path = _cache_path(
+        cache_dir, cache_key(model_id, instruction, temperature, max_tokens)
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {"model_id": model_id, "version": version, "raw_text": raw_text}
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return path
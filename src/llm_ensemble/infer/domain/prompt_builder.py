@@ -5,9 +5,12 @@ No I/O - templates are loaded by adapters and passed in.
 """
 
 from __future__ import annotations
-from typing import Optional
+import functools
+from typing import Callable, Iterable, Iterator, Optional
 from jinja2 import Template
 
+from llm_ensemble.ingest.domain.models import JudgingExample
+
 
 def build_instruction(
     template: Template,
@@ -48,6 +51,154 @@ def build_instruction(
     )
 
 
+def make_instruction_builder(
+    template: Template,
+    role: bool = True,
+    description: Optional[str] = None,
+    narrative: Optional[str] = None,
+    aspects: bool = False,
+) -> Callable[[JudgingExample], str]:
+    """Bind batch-constant template variables once, returning a per-example builder.
+
+    In the inference loop the template and its static variables (role,
+    description, narrative, aspects) are identical for every example; only
+    query and page_text change. Binding the constants up front means each
+    call only passes the two varying fields, read via attribute access
+    (no per-call dict probes).
+
+    Args:
+        template: Jinja2 Template object
+        role: Whether to include the role description
+        description: Optional query description
+        narrative: Optional query narrative
+        aspects: Whether to include multi-aspect evaluation
+
+    Returns:
+        Callable taking a JudgingExample and returning the rendered
+        instruction string
+
+    Example:
+        >>> build = make_instruction_builder(template, role=True)
+        >>> build(JudgingExample(query_text="python", doc="Python is...", ...))
+        'You are a search quality rater...'
+    """
+    render = functools.partial(
+        template.render,
+        role=role,
+        description=description,
+        narrative=narrative,
+        aspects=aspects,
+    )
+
+    def build(example: JudgingExample) -> str:
+        return render(query=example.query_text, page_text=example.doc)
+
+    return build
+
+
+# Sentinel inserted where the document text belongs; NUL bytes can't occur
+# in rendered template output, so the split-point is unambiguous
+_DOC_PLACEHOLDER = "\x00__DOC__\x00"
+
+
+@functools.lru_cache(maxsize=128)
+def make_query_instruction_builder(
+    template: Template,
+    query: str,
+    role: bool = True,
+    description: Optional[str] = None,
+    narrative: Optional[str] = None,
+    aspects: bool = False,
+) -> Callable[[str], str]:
+    """Pre-render everything but the document for one query, once.
+
+    In IR evaluation the same query is judged against many documents, and
+    rendering is dominated by the static instruction boilerplate. Render
+    the template once with a placeholder where the page text goes, split
+    into a (prefix, suffix) pair, and build each instruction by plain
+    string concatenation — no Jinja in the per-document loop. Memoized per
+    (template, query, variables) so repeated queries reuse the split.
+
+    Args:
+        template: Jinja2 Template object
+        query: The search query text (constant across the documents)
+        role: Whether to include the role description
+        description: Optional query description
+        narrative: Optional query narrative
+        aspects: Whether to include multi-aspect evaluation
+
+    Returns:
+        Callable taking the document text and returning the full instruction
+
+    Example:
+        >>> build = make_query_instruction_builder(template, "python tutorial")
+        >>> build("Learn Python...")
+        'You are a search quality rater...'
+    """
+    rendered = template.render(
+        query=query,
+        page_text=_DOC_PLACEHOLDER,
+        role=role,
+        description=description,
+        narrative=narrative,
+        aspects=aspects,
+    )
+    if rendered.count(_DOC_PLACEHOLDER) != 1:
+        # Template doesn't interpolate page_text verbatim exactly once
+        # (absent, filtered, or repeated); fall back to a full render per
+        # document rather than splice into the wrong number of slots
+        build = make_instruction_builder(
+            template, role=role, description=description,
+            narrative=narrative, aspects=aspects,
+        )
+        return lambda page_text: build(
+            JudgingExample.model_construct(query_text=query, doc=page_text)
+        )
+
+    prefix, _, suffix = rendered.partition(_DOC_PLACEHOLDER)
+
+    def build_for_doc(page_text: str) -> str:
+        return prefix + page_text + suffix
+
+    return build_for_doc
+
+
+def build_instruction_batch(
+    template: Template,
+    examples: Iterable[JudgingExample],
+    role: bool = True,
+    description: Optional[str] = None,
+    narrative: Optional[str] = None,
+    aspects: bool = False,
+) -> Iterator[str]:
+    """Render instructions for a batch of examples with one-time setup.
+
+    Binds the batch-constant variables once (via make_instruction_builder)
+    and then renders each example, so the per-example cost is just the two
+    varying fields instead of rebuilding the full keyword set per call.
+
+    Args:
+        template: Jinja2 Template object
+        examples: Iterable of JudgingExample objects
+        role: Whether to include the role description
+        description: Optional query description
+        narrative: Optional query narrative
+        aspects: Whether to include multi-aspect evaluation
+
+    Yields:
+        Rendered instruction strings, in example order
+
+    Example:
+        >>> list(build_instruction_batch(template, [example1, example2]))
+        ['You are a search quality rater...', ...]
+    """
+    build = make_instruction_builder(
+        template, role=role, description=description,
+        narrative=narrative, aspects=aspects,
+    )
+    return map(build, examples)
+
+
 def build_instruction_from_judging_example(
     template: Template,
     example: dict,
@@ -6,8 +6,102 @@ Handles the thomas-et-al prompt format which expects JSON output.
 
 from __future__ import annotations
 import json
-import re
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+# A response parser takes raw model output and returns (label, warnings)
+ParserFunction = Callable[[str], tuple[Optional[int], list[str]]]
+
+# orjson (install via the "perf" extra) halves decode time on the short JSON
+# snippets parsed here; its JSONDecodeError subclasses json.JSONDecodeError,
+# so the except clauses below cover both. Pre-binding also skips the module
+# attribute lookup in the hot path.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+_WHITESPACE = " \t\r\n"
+
+# Tuple beats set for 3-element membership on small ints (no hashing), and a
+# module constant avoids rebuilding the literal on every call
+_VALID_O_SCORES = (0, 1, 2)
+
+# Exact-match table for the most common responses: a deterministic model in
+# simple mode emits literally '{"O": N}', so one dict probe replaces even the
+# character scan for the hottest inputs
+_LITERAL_RESPONSES = {
+    f'{{"O":{sep}{score}}}': score
+    for score in _VALID_O_SCORES
+    for sep in ("", " ")
+}
+
+
+def _scan_o_score(raw_text: str) -> Optional[int]:
+    """Extract the O score with a direct string scan, no regex or JSON.
+
+    Locates the last '"O"' occurrence, skips past the colon and any
+    whitespace, and reads a single digit. The match must sit inside a
+    still-open object — an unclosed '{' before it and a '}' after it — so
+    prose restatements of the score outside the JSON don't match. Returns
+    the score when the scan succeeds cleanly, or None to signal that the
+    caller should fall back to the JSON extraction path.
+    """
+    idx = raw_text.rfind('"O"')
+    if idx == -1:
+        return None
+    open_idx = raw_text.rfind("{", 0, idx)
+    if open_idx == -1:
+        return None
+    # A '}' between the brace and the match means that object already
+    # closed; this "O" is prose, and the JSON path should decide instead
+    if raw_text.rfind("}", open_idx, idx) != -1:
+        return None
+    i = idx + 3
+    n = len(raw_text)
+    while i < n and raw_text[i] in _WHITESPACE:
+        i += 1
+    if i >= n or raw_text[i] != ":":
+        return None
+    i += 1
+    while i < n and raw_text[i] in _WHITESPACE:
+        i += 1
+    if i >= n or not raw_text[i].isdigit():
+        return None
+    # Multi-digit values can't be valid scores; let the slow path warn
+    if i + 1 < n and raw_text[i + 1].isdigit():
+        return None
+    if raw_text.find("}", i + 1) == -1:
+        return None
+    score = ord(raw_text[i]) - 48
+    return score if score in _VALID_O_SCORES else None
+
+
+def _extract_json_object(raw_text: str) -> Optional[str]:
+    """Slice out the JSON object surrounding the last '"O"' occurrence.
+
+    str.find/rfind run on CPython's C fastsearch (memmem-style), so locating
+    the object costs a linear byte scan instead of a regex engine pass. The
+    opening brace is searched in a short bounded window and the closing brace
+    via a brace-depth counter, since the expected objects ({"O": N} or
+    {"M": .., "T": .., "O": N}) are tiny.
+    """
+    idx = raw_text.rfind('"O"')
+    if idx == -1:
+        return None
+    open_idx = raw_text.rfind("{", max(0, idx - 64), idx)
+    if open_idx == -1:
+        return None
+    depth = 0
+    for i in range(open_idx, min(len(raw_text), open_idx + 256)):
+        char = raw_text[i]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return raw_text[open_idx:i + 1]
+    return None
 
 
 def parse_thomas_response(raw_text: str) -> tuple[Optional[int], list[str]]:
@@ -33,27 +127,51 @@ def parse_thomas_response(raw_text: str) -> tuple[Optional[int], list[str]]:
         >>> parse_thomas_response('The answer is {"O": 1} based on...')
         (1, [])
         >>> parse_thomas_response('invalid')
-        (None, ['Failed to parse JSON from response'])
+        (None, ["No JSON object with 'O' field found in response"])
     """
+    # Literal fast path: the hottest responses are exactly '{"O": N}'
+    literal = _LITERAL_RESPONSES.get(raw_text)
+    if literal is not None:
+        return literal, []
+
     warnings = []
 
-    # Try to find JSON object in the response
-    # Look for patterns like {"O": N} or {"M": N, "T": N, "O": N}
-    json_match = re.search(r'\{[^}]*"O"\s*:\s*\d+[^}]*\}', raw_text)
+    # Fastest path: a direct character scan for the O score, which covers
+    # well-formed simple and multi-aspect responses without regex or JSON.
+    scanned = _scan_o_score(raw_text)
+    if scanned is not None:
+        return scanned, warnings
+
+    # Fast path: cooperative models return just the JSON object, so try
+    # decoding it directly before paying for a regex scan over the full text.
+    stripped = raw_text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        try:
+            data = _loads(stripped)
+        except json.JSONDecodeError:
+            pass  # Malformed despite the braces; fall through to the regex path
+        else:
+            return _extract_o_score(data, warnings)
 
-    if not json_match:
+    # Slow path: slice the embedded JSON object out of the response and
+    # decode it, so malformed values still produce precise warnings
+    json_str = _extract_json_object(raw_text)
+
+    if json_str is None:
         warnings.append("No JSON object with 'O' field found in response")
         return None, warnings
 
-    json_str = json_match.group(0)
-
     try:
-        data = json.loads(json_str)
+        data = _loads(json_str)
     except json.JSONDecodeError as e:
         warnings.append(f"Failed to parse JSON: {e}")
         return None, warnings
 
-    # Extract the O score
+    return _extract_o_score(data, warnings)
+
+
+def _extract_o_score(data: dict, warnings: list[str]) -> tuple[Optional[int], list[str]]:
+    """Validate and extract the O score from a parsed JSON object."""
     o_score = data.get("O")
 
     if o_score is None:
@@ -61,8 +179,120 @@ def parse_thomas_response(raw_text: str) -> tuple[Optional[int], list[str]]:
         return None, warnings
 
     # Validate the score is 0, 1, or 2
-    if not isinstance(o_score, int) or o_score not in [0, 1, 2]:
+    if type(o_score) is not int or o_score not in _VALID_O_SCORES:
         warnings.append(f"Invalid O score: {o_score} (expected 0, 1, or 2)")
         return None, warnings
 
     return o_score, warnings
+
+
+def parse_thomas_response_simple(raw_text: str) -> tuple[Optional[int], list[str]]:
+    """Specialized parser for the simple '{"O": N}' response shape.
+
+    For corpora judged with aspects disabled the model returns exactly the
+    minimal object, so this parser is a single character scan with no JSON
+    decoding and no fallback extraction. Select it via the prompt config
+    (response_parser: parse_thomas_response_simple) when the prompt uses
+    the simple output format; responses that don't match the shape fail
+    with a warning rather than being rescued.
+
+    Args:
+        raw_text: Raw text response from the LLM
+
+    Returns:
+        Tuple of (label, warnings), same contract as parse_thomas_response
+
+    Example:
+        >>> parse_thomas_response_simple('{"O": 2}')
+        (2, [])
+        >>> parse_thomas_response_simple('Sure! {"O": 2}')
+        (None, ['Response is not a bare {"O": N} object'])
+    """
+    stripped = raw_text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        score = _scan_o_score(stripped)
+        if score is not None:
+            return score, []
+    return None, ['Response is not a bare {"O": N} object']
+
+
+@dataclass
+class ParseResult:
+    """Structure-of-arrays result of a batch parse.
+
+    Labels are kept in one flat list aligned with the input, and warnings
+    are stored sparsely by input index: successful parses (the common
+    case) never allocate a warnings entry.
+    """
+
+    labels: list[Optional[int]] = field(default_factory=list)
+    warnings: dict[int, list[str]] = field(default_factory=dict)
+
+
+def parse_thomas_batch(raw_texts: list[str]) -> ParseResult:
+    """Parse a batch of thomas-et-al responses for offline reprocessing.
+
+    Intended for post-hoc scoring of large NDJSON dumps where per-call
+    dispatch overhead adds up. Binds the parser once and runs a tight
+    list loop, so the per-response cost is dominated by the character
+    scan itself rather than function lookup.
+
+    Args:
+        raw_texts: Raw model responses, one per judgement
+
+    Returns:
+        ParseResult with labels aligned to raw_texts (None on failure) and
+        warnings keyed by the index of the response that produced them
+
+    Example:
+        >>> result = parse_thomas_batch(['{"O": 2}', 'invalid'])
+        >>> result.labels
+        [2, None]
+        >>> result.warnings
+        {1: ["No JSON object with 'O' field found in response"]}
+    """
+    parse = parse_thomas_response
+    result = ParseResult()
+    labels = result.labels
+    for i, raw_text in enumerate(raw_texts):
+        label, warnings = parse(raw_text)
+        labels.append(label)
+        if warnings:
+            result.warnings[i] = warnings
+    return result
+
+
+# Registry of response parsers, keyed by the names used in prompt configs
+# (PromptConfig.response_parser). Populated at import time so lookup is a
+# plain dict access with no reflection.
+_PARSER_REGISTRY: dict[str, ParserFunction] = {
+    "parse_thomas_response": parse_thomas_response,
+    "parse_thomas_response_simple": parse_thomas_response_simple,
+}
+
+
+def load_parser(parser_name: str) -> ParserFunction:
+    """Look up a response parser by its registered name.
+
+    Args:
+        parser_name: Parser identifier from the prompt config
+            (e.g., "parse_thomas_response")
+
+    Returns:
+        The parser function
+
+    Raises:
+        ValueError: If no parser is registered under that name
+
+    Example:
+        >>> parser = load_parser("parse_thomas_response")
+        >>> parser('{"O": 2}')
+        (2, [])
+    """
+    try:
+        return _PARSER_REGISTRY[parser_name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown response parser: {parser_name!r}. "
+            f"Available parsers: {', '.join(sorted(_PARSER_REGISTRY))}"
+        ) from None
@@ -0,0 +1,115 @@
+"""Tests for the OpenRouter Batch API adapter.
+
+collect_batch's download parsing and error handling are exercised with a
+stubbed client, so no credentials or network access are needed.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from llm_ensemble.infer.adapters import openrouter_batch
+from llm_ensemble.infer.adapters.openrouter_batch import collect_batch
+
+
+def _stub_client(records: list[dict], status: str = "completed") -> SimpleNamespace:
+    """Build a client whose batch download returns the given output records."""
+    batch = SimpleNamespace(status=status, output_file_id="file-1")
+    text = "\n".join(json.dumps(record) for record in records)
+    return SimpleNamespace(
+        batches=SimpleNamespace(retrieve=lambda batch_id: batch),
+        files=SimpleNamespace(content=lambda file_id: SimpleNamespace(text=text)),
+    )
+
+
+def _success_record(custom_id: str, content: str) -> dict:
+    """Build a successful batch output line."""
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "body": {
+                "model": "fake/fake-model-v1",
+                "choices": [{"message": {"content": content}}],
+            }
+        },
+    }
+
+
+class TestCollectBatch:
+    """Test download parsing, error records, and status validation."""
+
+    def _collect(self, monkeypatch, records, status="completed"):
+        client = _stub_client(records, status=status)
+        monkeypatch.setattr(
+            openrouter_batch, "_get_client", lambda api_key, timeout: client
+        )
+        return list(collect_batch("batch-1", "fake/fake-model", api_key="key"))
+
+    def test_successful_records_are_parsed(self, monkeypatch):
+        """Test that responses go through the parser with IDs recovered."""
+        judgements = self._collect(
+            monkeypatch,
+            [
+                _success_record("q1|d1", '{"O": 2}'),
+                _success_record("q2|d2", '{"O": 0}'),
+            ],
+        )
+
+        assert [(j["query_id"], j["docid"], j["label"]) for j in judgements] == [
+            ("q1", "d1", 2),
+            ("q2", "d2", 0),
+        ]
+        assert judgements[0]["version"] == "fake/fake-model-v1"
+        assert judgements[0]["warnings"] == []
+
+    def test_failed_record_yields_error_judgement(self, monkeypatch):
+        """Test that a null-response failure doesn't abort the collection."""
+        judgements = self._collect(
+            monkeypatch,
+            [
+                _success_record("q1|d1", '{"O": 1}'),
+                {
+                    "custom_id": "q2|d2",
+                    "response": None,
+                    "error": {"message": "rate limited"},
+                },
+                _success_record("q3|d3", '{"O": 2}'),
+            ],
+        )
+
+        assert len(judgements) == 3
+        failed = judgements[1]
+        assert failed["query_id"] == "q2"
+        assert failed["label"] is None
+        assert failed["raw_text"] == ""
+        assert failed["warnings"] == ["Batch request failed: rate limited"]
+        # Later records still come through
+        assert judgements[2]["label"] == 2
+
+    def test_body_without_choices_is_treated_as_failure(self, monkeypatch):
+        """Test a response body carrying an error object instead of choices."""
+        judgements = self._collect(
+            monkeypatch,
+            [
+                {
+                    "custom_id": "q1|d1",
+                    "response": {"body": {"error": {"message": "model overloaded"}}},
+                }
+            ],
+        )
+
+        assert judgements[0]["label"] is None
+        assert judgements[0]["warnings"] == [
+            "Batch request failed: model overloaded"
+        ]
+
+    def test_incomplete_batch_raises(self, monkeypatch):
+        """Test that collecting a non-completed batch is rejected."""
+        client = _stub_client([], status="in_progress")
+        monkeypatch.setattr(
+            openrouter_batch, "_get_client", lambda api_key, timeout: client
+        )
+
+        with pytest.raises(RuntimeError, match="not completed"):
+            list(collect_batch("batch-1", "fake/fake-model", api_key="key"))
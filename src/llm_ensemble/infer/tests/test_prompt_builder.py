@@ -7,12 +7,13 @@ from jinja2 import Template
 from llm_ensemble.infer.domain.prompt_builder import (
     build_instruction,
     build_instruction_from_judging_example,
+    make_query_instruction_builder,
 )
 from llm_ensemble.infer.adapters.prompt_loader import load_prompt_template
 
 
 # Fixture: Load the thomas-et-al template once for all tests
-@pytest.fixture
+@pytest.fixture(scope="session")
 def thomas_template():
     """Load the thomas-et-al-prompt.jinja template from centralized configs."""
     return load_prompt_template("thomas-et-al-prompt")
@@ -102,3 +103,43 @@ def test_minimal_instruction(thomas_template):
     assert "0 to 2" in result  # Score scale
     assert "—BEGIN WEB PAGE CONTENT—" in result
     assert "—END WEB PAGE CONTENT—" in result
+
+
+def test_query_builder_matches_full_render(thomas_template):
+    """Test the prefix/suffix splice is byte-identical to a full render."""
+    build = make_query_instruction_builder(thomas_template, "python tutorial")
+    expected = build_instruction(
+        template=thomas_template,
+        query="python tutorial",
+        page_text="Learn Python basics.",
+    )
+
+    assert build("Learn Python basics.") == expected
+
+
+def test_query_builder_is_memoized(thomas_template):
+    """Test that repeated queries reuse the same builder."""
+    first = make_query_instruction_builder(thomas_template, "same query")
+    second = make_query_instruction_builder(thomas_template, "same query")
+
+    assert first is second
+
+
+def test_query_builder_repeated_page_text_falls_back():
+    """Test that a template interpolating page_text twice still renders cleanly."""
+    template = Template("A: {{ page_text }} B: {{ page_text }} Q: {{ query }}")
+    build = make_query_instruction_builder(template, "q")
+    result = build("doc")
+
+    assert result == "A: doc B: doc Q: q"
+    assert "\x00" not in result
+
+
+def test_query_builder_without_page_text_falls_back():
+    """Test that a template ignoring page_text doesn't leak the placeholder."""
+    template = Template("Only the query: {{ query }}")
+    build = make_query_instruction_builder(template, "python")
+    result = build("unused doc")
+
+    assert result == "Only the query: python"
+    assert "\x00" not in result
@@ -0,0 +1,55 @@
+"""Tests for the on-disk response cache."""
+
+from pathlib import Path
+
+from llm_ensemble.infer.adapters.response_cache import (
+    cache_key,
+    load_cached_response,
+    store_cached_response,
+)
+
+
+class TestCacheKey:
+    """Test the key derivation."""
+
+    def test_key_is_stable(self):
+        """Test that identical requests produce identical keys."""
+        assert cache_key("m", "prompt", 0.0, 256) == cache_key("m", "prompt", 0.0, 256)
+
+    def test_key_varies_with_every_component(self):
+        """Test that model, instruction, and sampling params all distinguish keys."""
+        base = cache_key("m", "prompt", 0.0, 256)
+        assert cache_key("other", "prompt", 0.0, 256) != base
+        assert cache_key("m", "other prompt", 0.0, 256) != base
+        assert cache_key("m", "prompt", 0.7, 256) != base
+        assert cache_key("m", "prompt", 0.0, 512) != base
+
+
+class TestCacheRoundtrip:
+    """Test store/load behavior against a temp cache directory."""
+
+    def test_store_then_load(self, tmp_path: Path):
+        """Test that a stored response is returned on lookup."""
+        store_cached_response(
+            "m", "prompt", 0.0, 256, '{"O": 2}', version="m-v1", cache_dir=tmp_path
+        )
+        cached = load_cached_response("m", "prompt", 0.0, 256, cache_dir=tmp_path)
+        assert cached is not None
+        assert cached["raw_text"] == '{"O": 2}'
+        assert cached["version"] == "m-v1"
+
+    def test_miss_returns_none(self, tmp_path: Path):
+        """Test that an unknown request is a miss."""
+        assert load_cached_response("m", "prompt", 0.0, 256, cache_dir=tmp_path) is None
+
+    def test_different_params_do_not_collide(self, tmp_path: Path):
+        """Test that a cached response is not served for other sampling params."""
+        store_cached_response("m", "prompt", 0.0, 256, "resp", cache_dir=tmp_path)
+        assert load_cached_response("m", "prompt", 0.7, 256, cache_dir=tmp_path) is None
+        assert load_cached_response("m", "prompt", 0.0, 512, cache_dir=tmp_path) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        """Test that a truncated entry (interrupted write) reads as a miss."""
+        path = store_cached_response("m", "prompt", 0.0, 256, "resp", cache_dir=tmp_path)
+        path.write_text('{"raw_text": ')
+        assert load_cached_response("m", "prompt", 0.0, 256, cache_dir=tmp_path) is None
@@ -0,0 +1,165 @@
+"""Tests for the thomas-et-al response parser.
+
+The parser is layered (literal table, character scan, direct JSON decode,
+embedded-object extraction), so these tests pin down each path plus the
+edge cases that distinguish them: quoted digits, multi-digit scores,
+unterminated objects, and prose-embedded JSON.
+"""
+
+import pytest
+
+from llm_ensemble.infer.domain.response_parser import (
+    load_parser,
+    parse_thomas_batch,
+    parse_thomas_response,
+    parse_thomas_response_simple,
+)
+
+
+class TestParseThomasResponse:
+    """Test the full parser across its fast and fallback paths."""
+
+    def test_literal_simple_response(self):
+        """Test the exact-match table for bare simple responses."""
+        assert parse_thomas_response('{"O": 2}') == (2, [])
+        assert parse_thomas_response('{"O":1}') == (1, [])
+        assert parse_thomas_response('{"O": 0}') == (0, [])
+
+    def test_multi_aspect_response(self):
+        """Test the M/T/O multi-aspect format."""
+        assert parse_thomas_response('{"M": 2, "T": 1, "O": 1}') == (1, [])
+
+    def test_prose_embedded_object(self):
+        """Test extraction when the JSON object is surrounded by prose."""
+        label, warnings = parse_thomas_response(
+            'The answer is {"O": 1} based on the page content.'
+        )
+        assert label == 1
+        assert warnings == []
+
+    def test_whitespace_inside_object(self):
+        """Test tolerance for newlines and extra spaces around the score."""
+        assert parse_thomas_response('{\n  "O" :  2\n}') == (2, [])
+
+    def test_quoted_score_is_invalid(self):
+        """Test that a string-typed score is rejected, not coerced."""
+        label, warnings = parse_thomas_response('{"O": "2"}')
+        assert label is None
+        assert warnings == ["Invalid O score: 2 (expected 0, 1, or 2)"]
+
+    def test_multi_digit_score_is_invalid(self):
+        """Test that scores outside a single digit fail with a warning."""
+        label, warnings = parse_thomas_response('{"O": 10}')
+        assert label is None
+        assert warnings == ["Invalid O score: 10 (expected 0, 1, or 2)"]
+
+    def test_out_of_range_score_is_invalid(self):
+        """Test that a single digit outside 0-2 fails with a warning."""
+        label, warnings = parse_thomas_response('{"O": 3}')
+        assert label is None
+        assert warnings == ["Invalid O score: 3 (expected 0, 1, or 2)"]
+
+    def test_unterminated_object(self):
+        """Test that an object missing its closing brace is not rescued."""
+        label, warnings = parse_thomas_response('{"O": 2')
+        assert label is None
+        assert warnings == ["No JSON object with 'O' field found in response"]
+
+    def test_missing_o_field(self):
+        """Test an otherwise valid object without the O key."""
+        label, warnings = parse_thomas_response('{"M": 2, "T": 1}')
+        assert label is None
+        assert warnings == ["Missing 'O' field in parsed JSON"]
+
+    def test_no_json_at_all(self):
+        """Test plain prose with no JSON object."""
+        label, warnings = parse_thomas_response("The page is highly relevant.")
+        assert label is None
+        assert warnings == ["No JSON object with 'O' field found in response"]
+
+    def test_prose_o_without_object_does_not_match(self):
+        """Test that a quoted "O" outside any braces is not treated as a score."""
+        label, warnings = parse_thomas_response('The "O": 2 rating applies.')
+        assert label is None
+        assert warnings
+
+    def test_prose_restatement_outside_object_is_ignored(self):
+        """Test that a restated score after the object doesn't override it."""
+        label, warnings = parse_thomas_response(
+            '{"O": 0} overall "O": 1 seems right}'
+        )
+        assert label == 0
+        assert warnings == []
+
+    def test_last_object_wins(self):
+        """Test that the final verdict is taken when the model restates it."""
+        label, warnings = parse_thomas_response(
+            'First I thought {"O": 0} but on reflection {"O": 2}'
+        )
+        assert label == 2
+        assert warnings == []
+
+
+class TestParseThomasResponseSimple:
+    """Test the strict bare-object parser."""
+
+    def test_bare_object(self):
+        """Test the expected minimal response shape."""
+        assert parse_thomas_response_simple('{"O": 2}') == (2, [])
+
+    def test_surrounding_whitespace_is_tolerated(self):
+        """Test that leading/trailing whitespace is stripped first."""
+        assert parse_thomas_response_simple('  {"O": 0}\n') == (0, [])
+
+    def test_prose_prefix_is_rejected(self):
+        """Test that anything beyond the bare object fails, not rescued."""
+        label, warnings = parse_thomas_response_simple('Sure! {"O": 2}')
+        assert label is None
+        assert warnings == ['Response is not a bare {"O": N} object']
+
+    def test_invalid_score_is_rejected(self):
+        """Test that out-of-range scores fail the strict shape check."""
+        label, warnings = parse_thomas_response_simple('{"O": 7}')
+        assert label is None
+        assert warnings == ['Response is not a bare {"O": N} object']
+
+
+class TestParseThomasBatch:
+    """Test the batch entry point and its sparse warning layout."""
+
+    def test_labels_align_with_input(self):
+        """Test that labels keep input order, with None for failures."""
+        result = parse_thomas_batch(['{"O": 2}', "invalid", '{"O": 0}'])
+        assert result.labels == [2, None, 0]
+
+    def test_warnings_are_keyed_by_index(self):
+        """Test that only failing responses get a warnings entry."""
+        result = parse_thomas_batch(['{"O": 2}', "invalid"])
+        assert result.warnings == {
+            1: ["No JSON object with 'O' field found in response"]
+        }
+
+    def test_empty_batch(self):
+        """Test that an empty input produces an empty result."""
+        result = parse_thomas_batch([])
+        assert result.labels == []
+        assert result.warnings == {}
+
+
+class TestLoadParser:
+    """Test the parser registry lookup."""
+
+    def test_known_parsers(self):
+        """Test that registered names resolve to the right functions."""
+        assert load_parser("parse_thomas_response") is parse_thomas_response
+        assert (
+            load_parser("parse_thomas_response_simple")
+            is parse_thomas_response_simple
+        )
+
+    def test_unknown_parser_raises(self):
+        """Test that unknown names raise ValueError listing the options."""
+        with pytest.raises(ValueError, match="Unknown response parser"):
+            load_parser("no_such_parser")
+        with pytest.raises(ValueError, match="parse_thomas_response"):
+            load_parser("no_such_parser")
@@ -1,34 +1,75 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional
-import sys
+from typing import TYPE_CHECKING, Iterator, Optional
+import itertools
+import logging
 import json
+import os
+import statistics
 
 import typer
 
-from llm_ensemble.ingest.domain.models import JudgingExample
-from llm_ensemble.infer.adapters.config_loader import load_model_config
-from llm_ensemble.infer.adapters.inference_router import iter_judgements
-from llm_ensemble.libs.logging import configure_logging
-from llm_ensemble.libs.runtime.run_manager import create_run_id, get_run_dir, write_manifest
-from llm_ensemble.libs.runtime.git_utils import get_git_info
+# Heavy imports (pydantic models, the openai SDK behind the router) are
+# deferred into the functions that need them so --help and tab-completion
+# don't pay the full adapter stack's import time.
+if TYPE_CHECKING:
+    from llm_ensemble.ingest.domain.models import JudgingExample
 
 app = typer.Typer(add_completion=False, help="LLM Ensemble – inference CLI")
 
 
-def _read_examples(input_path: Path) -> list[JudgingExample]:
-    """Read NDJSON examples from file."""
-    examples = []
-    with input_path.open("r") as f:
-        for line in f:
-            if line.strip():
-                examples.append(JudgingExample(**json.loads(line)))
-    return examples
+def _iter_examples(input_path: Path, validate: bool = False) -> Iterator["JudgingExample"]:
+    """Stream NDJSON examples from file, one record at a time.
 
+    By default the input is trusted — it comes from our own ingest CLI —
+    so each line is decoded and handed to model_construct, which fills the
+    model directly without running validators. With validate=True, lines
+    go through pydantic-core's fused JSON-to-model path instead
+    (model_validate_json), for inputs of unknown provenance. Yielding
+    lazily keeps memory O(1) and lets inference start before the whole
+    file has been parsed.
+    """
+    from llm_ensemble.ingest.domain.models import JudgingExample
 
-def _json_dumps(judgement) -> str:
-    """Serialize ModelJudgement to JSON."""
-    return judgement.model_dump_json()
+    try:
+        from orjson import loads as _loads
+    except ImportError:
+        _loads = json.loads
+
+    with input_path.open("rb") as f:
+        if validate:
+            for line in f:
+                if line.strip():
+                    yield JudgingExample.model_validate_json(line)
+        else:
+            for line in f:
+                if line.strip():
+                    yield JudgingExample.model_construct(**_loads(line))
+
+
+def _read_completed(output_path: Path) -> tuple[set[tuple[str, str]], int]:
+    """Read (query_id, docid) pairs already judged in a previous run.
+
+    Used for checkpoint/resume: judgements already flushed to the output
+    file don't need to be re-run (and re-paid) after a crash. The very
+    crash being resumed from can leave a partially written final record
+    (the sink is buffered and only fsync'd at the end), so reading stops
+    at the first line that doesn't decode and the byte offset of the
+    clean prefix is returned alongside the pairs — the caller truncates
+    the garbage tail before appending.
+    """
+    completed: set[tuple[str, str]] = set()
+    valid_bytes = 0
+    with output_path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                completed.add((record["query_id"], record["docid"]))
+            valid_bytes += len(line)
+    return completed, valid_bytes
 
 
 @app.command("infer")
@@ -55,6 +96,20 @@ def infer(
     prompt: str = typer.Option(
         "thomas-et-al-prompt", "--prompt", "-p", help="Prompt template name (without .jinja extension)"
     ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Resume a crashed run: skip examples already in the output file and append (requires --run-id)"
+    ),
+    concurrency: int = typer.Option(
+        5, "--concurrency", "-c", min=1,
+        help="Number of in-flight inference requests (1 = sequential)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk response cache and always call the provider"
+    ),
+    validate_input: bool = typer.Option(
+        False, "--validate-input/--no-validate-input",
+        help="Re-validate each input record (off by default: ingest already validated them)"
+    ),
 ):
     """Run LLM inference on judging examples and output structured judgements.
 
@@ -68,6 +123,25 @@ def infer(
         OPENROUTER_API_KEY: OpenRouter API key (required for OpenRouter models)
         HF_TOKEN: HuggingFace API token (required for HF models)
     """
+    # Without an explicit run ID a fresh run dir would be created and there
+    # would be nothing to resume from, so reject the combination up front
+    if resume and run_id is None:
+        raise typer.BadParameter(
+            "--resume requires --run-id to identify the run to resume",
+            param_hint="--resume",
+        )
+
+    from llm_ensemble.infer.domain.models import ModelJudgement
+    from llm_ensemble.infer.adapters.config_loader import load_model_config
+    from llm_ensemble.infer.adapters.inference_router import iter_judgements
+    from llm_ensemble.libs.logging import configure_logging
+    from llm_ensemble.libs.runtime.run_manager import create_run_id, get_run_dir, write_manifest
+    from llm_ensemble.libs.runtime.git_utils import get_git_info
+
+    # pydantic-core's Rust serializer emits bytes directly, skipping the
+    # model_dump_json wrapper and its str -> bytes re-encode per call
+    judgement_to_json = ModelJudgement.__pydantic_serializer__.to_json
+
     # Load model config
     try:
         model_config = load_model_config(model, config_dir)
@@ -99,69 +173,109 @@ def infer(
     typer.echo(f"Run ID: {run_id}", err=True)
     typer.echo(f"Output: {output_file}", err=True)
 
-    # Read examples
+    # Stream examples lazily so inference starts before the file is parsed
     typer.echo(f"Reading examples from {input_file}...", err=True)
-    examples = _read_examples(input_file)
-    typer.echo(f"Loaded {len(examples)} examples", err=True)
+    examples = _iter_examples(input_file, validate=validate_input)
+
+    # Resume support: skip examples whose judgement was already flushed
+    completed: set[tuple[str, str]] = set()
+    if resume and output_file.exists():
+        completed, valid_bytes = _read_completed(output_file)
+        if valid_bytes < output_file.stat().st_size:
+            # Drop the half-record the crash left behind so the resumed
+            # file doesn't carry garbage mid-stream for downstream readers
+            typer.echo(
+                "Discarding partially written record at end of previous output",
+                err=True,
+            )
+            os.truncate(output_file, valid_bytes)
+        examples = (ex for ex in examples if (ex.query_id, ex.docid) not in completed)
+        typer.echo(
+            f"Resuming: {len(completed)} judgements already present", err=True
+        )
 
     if limit is not None:
-        examples = examples[:limit]
-        typer.echo(f"Limited to {len(examples)} examples", err=True)
+        examples = itertools.islice(examples, limit)
+        typer.echo(f"Limiting to at most {limit} examples", err=True)
 
     logger.info(
         "inference_started",
         model=model_config.model_id,
         provider=model_config.provider,
-        num_samples=len(examples),
+        limit=limit,
         input_file=str(input_file),
         prompt_template=prompt,
+        resumed_count=len(completed),
+        concurrency=concurrency,
     )
 
     # Run inference
     count = 0
     error_count = 0
-    total_latency_ms = 0.0
+    # Raw floats only in the loop; averaging and formatting happen once at
+    # the end so the hot path does a single list append per judgement
+    latencies_ms: list[float] = []
+
+    # Checked once so the hot loop skips kwargs construction when DEBUG is off
+    debug_enabled = logging.getLogger("infer").isEnabledFor(logging.DEBUG)
 
     try:
         typer.echo(f"Starting inference with prompt: {prompt}", err=True)
-        with output_file.open("w", encoding="utf-8", newline="\n") as sink:
+        # 1 MiB buffer: judgement lines are a few KB, so this coalesces
+        # hundreds of records per write(2) instead of the default 8 KiB
+        sink = output_file.open("ab" if resume else "wb", buffering=1024 * 1024)
+        try:
             for judgement in iter_judgements(
-                iter(examples),
+                examples,
                 model_config,
                 prompts_dir=prompts_dir,
                 prompt_template_name=prompt,
+                concurrency=concurrency,
+                use_cache=not no_cache,
             ):
-                sink.write(_json_dumps(judgement) + "\n")
+                sink.write(judgement_to_json(judgement) + b"\n")
                 count += 1
-                total_latency_ms += judgement.latency_ms
+                latencies_ms.append(judgement.latency_ms)
 
                 # Track errors
                 if judgement.label is None:
                     error_count += 1
-                    logger.debug(
-                        "inference_failed",
-                        query_id=judgement.query_id,
-                        doc_id=judgement.doc_id,
-                        warnings=judgement.warnings,
-                    )
-                else:
+                    if debug_enabled:
+                        logger.debug(
+                            "inference_failed",
+                            query_id=judgement.query_id,
+                            docid=judgement.docid,
+                            warnings=judgement.warnings,
+                        )
+                elif debug_enabled:
                     logger.debug(
                         "inference_success",
                         query_id=judgement.query_id,
-                        doc_id=judgement.doc_id,
+                        docid=judgement.docid,
                         label=judgement.label,
                         latency_ms=judgement.latency_ms,
                     )
 
-                # Progress logging
-                if count % 10 == 0:
-                    typer.echo(f"Processed {count}/{len(examples)} examples...", err=True)
+                # Progress logging, throttled so fast models aren't
+                # bottlenecked on stderr formatting
+                if count % 50 == 0:
+                    typer.echo(f"Processed {count} examples...", err=True)
+        finally:
+            # One flush + fsync at the end instead of per-record writeback:
+            # the buffer coalesces writes during the run, and fsync ensures
+            # flushed judgements survive a crash for --resume
+            sink.flush()
+            os.fsync(sink.fileno())
+            sink.close()
 
+        avg_latency_ms = statistics.fmean(latencies_ms) if latencies_ms else 0
         logger.info(
             "inference_completed",
             judgement_count=count,
             error_count=error_count,
-            avg_latency_ms=total_latency_ms / count if count > 0 else 0,
+            avg_latency_ms=avg_latency_ms,
+            min_latency_ms=min(latencies_ms) if latencies_ms else 0,
+            max_latency_ms=max(latencies_ms) if latencies_ms else 0,
         )
 
     except Exception as e:
@@ -180,13 +294,16 @@ def infer(
             "input_file": str(input_file),
             "limit": limit,
             "prompt": prompt,
+            "concurrency": concurrency,
+            "no_cache": no_cache,
+            "validate_input": validate_input,
         },
         metadata={
-            "model_config": model_config.model_dump(),
+            "model_config": model_config.model_dump(mode="json", exclude_none=True),
             "prompt_template": prompt,
             "judgement_count": count,
             "error_count": error_count,
-            "avg_latency_ms": total_latency_ms / count if count > 0 else 0,
+            "avg_latency_ms": avg_latency_ms,
             "output_file": str(output_file),
             "log_file": str(log_file),
         },
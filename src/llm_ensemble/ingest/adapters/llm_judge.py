@@ -1,10 +1,20 @@
 from __future__ import annotations
 import json
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Generator, Iterable, Tuple
 
-from llm_ensemble.ingest.domain.models import Query, Document, Relevance, JudgingExample    
+from llm_ensemble.ingest.domain.models import Relevance, JudgingExample
+
+# orjson (install via the "perf" extra) decodes the document JSONL several
+# times faster than stdlib json and takes bytes directly; its JSONDecodeError
+# subclasses json.JSONDecodeError, so the except clause covers both.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 @dataclass(frozen=True)
 class LlmJudgePaths:
@@ -23,9 +33,14 @@ class LlmJudgePaths:
         return self.base_dir / "llm4eval_test_qrel_2024.txt"
 
 
-def read_queries(path: Path) -> Dict[str, Query]:
-    """Read TSV of (query_id, query_text) into a dict."""
-    out: Dict[str, Query] = {}
+def read_queries(path: Path) -> Dict[str, str]:
+    """Read TSV of (query_id, query_text) into a plain qid -> text dict.
+
+    Raw strings instead of Query models: the line format is fully checked
+    right here, so wrapping each row in a pydantic model would re-validate
+    the same two strings for no gain.
+    """
+    out: Dict[str, str] = {}
     with path.open("r", encoding="utf-8") as f:
         for i, line in enumerate(f, start=1):
             line = line.rstrip("\n")
@@ -35,27 +50,29 @@ def read_queries(path: Path) -> Dict[str, Query]:
             parts = line.split("\t", maxsplit=1)
             if len(parts) != 2:
                 raise ValueError(f"Invalid query line {i}: {line!r}")
-            qid, qtext = parts[0].strip(), parts[1].strip()
-            out[qid] = Query(query_id=qid, query_text=qtext)
+            out[parts[0].strip()] = parts[1].strip()
     return out
 
 
-def read_documents(path: Path) -> Dict[str, Document]:
-    out: Dict[str, Document] = {}
-    with path.open("r", encoding="utf-8") as f:
+def read_documents(path: Path) -> Dict[str, str]:
+    """Read the document JSONL into a plain docid -> text dict."""
+    out: Dict[str, str] = {}
+    # Binary mode feeds raw bytes straight to the JSON decoder, skipping
+    # Python's text-decode pass over what is by far the largest input file
+    with path.open("rb") as f:
         for i, line in enumerate(f, start=1):
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _loads(line)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSONL at line {i}: {e}") from e
             docid = obj.get("docid")
             doc = obj.get("doc")
             if not (isinstance(docid, str) and isinstance(doc, str)):
                 raise ValueError(f"Missing docid/doc at line {i}")
-            out[docid] = Document(docid=docid, doc=doc)
+            out[docid] = doc
     return out
 
 
@@ -77,20 +94,50 @@ def read_qrels(path: Path) -> Iterable[Relevance]:
 
 
 def iter_examples(base_dir: Path) -> Generator[JudgingExample, None, None]:
+    """Join queries, documents, and qrels into JudgingExample records.
+
+    The document file dwarfs the other two inputs, so the join is driven
+    by it: qrels are grouped by docid up front (queries stay dict-resident,
+    they are small) and documents are streamed one line at a time, yielding
+    every pending example for a doc before its text is discarded. Resident
+    memory is O(#qrels) instead of O(corpus size). Examples come out in
+    document-file order rather than qrel order.
+    """
     paths = LlmJudgePaths(base_dir)
     queries = read_queries(paths.queries)
-    docs = read_documents(paths.documents)
-    missing_q, missing_d = 0, 0
+    missing_q = 0
+    pending: Dict[str, list] = defaultdict(list)
     for r in read_qrels(paths.qrels):
-        q = queries.get(r.query_id)
-        d = docs.get(r.docid)
-        if q is None:
+        if r.query_id not in queries:
             missing_q += 1
             continue
-        if d is None:
-            missing_d += 1
-            continue
-        yield JudgingExample.from_parts("llm-judge-2024", q, d, r)
+        pending[r.docid].append(r)
+    with paths.documents.open("rb") as f:
+        for i, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = _loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSONL at line {i}: {e}") from e
+            docid = obj.get("docid")
+            doc = obj.get("doc")
+            if not (isinstance(docid, str) and isinstance(doc, str)):
+                raise ValueError(f"Missing docid/doc at line {i}")
+            for r in pending.pop(docid, ()):
+                # model_construct skips re-validation: every field was
+                # already checked by the readers or the Relevance model
+                yield JudgingExample.model_construct(
+                    dataset="llm-judge-2024",
+                    query_id=r.query_id,
+                    query_text=queries[r.query_id],
+                    docid=docid,
+                    doc=doc,
+                    gold_relevance=r.relevance,
+                )
+    # Whatever is still pending never appeared in the document file
+    missing_d = sum(len(rs) for rs in pending.values())
     if missing_q or missing_d:
         # Emit a warning summary; the CLI will surface this via logging
         print(
@@ -28,14 +28,3 @@ class JudgingExample(BaseModel):
     docid: str
     doc: str
     gold_relevance: int
-
-    @classmethod
-    def from_parts(
-        cls, dataset: str, q: Query, d: Document, r: Relevance
-    ) -> "JudgingExample":
-        assert q.query_id == r.query_id
-        assert d.docid == r.docid
-        return cls(
-            dataset=dataset, query_id=q.query_id, query_text=q.query_text,
-            docid=d.docid, doc=d.doc, gold_relevance=r.relevance,
-        )
@@ -124,8 +124,8 @@ class TestReadQueries:
         )
         queries = read_queries(qfile)
         assert len(queries) == 2
-        assert queries["q1"].query_text == "What is AI?"
-        assert queries["q2"].query_text == "Define ML"
+        assert queries["q1"] == "What is AI?"
+        assert queries["q2"] == "Define ML"
 
     def test_skip_empty_lines(self, tmp_path: Path):
         """Test that empty lines are ignored."""
@@ -141,7 +141,7 @@ class TestReadQueries:
             tmp_path, "queries.txt", "q1\tWhat is\tAI and ML?\n"
         )
         queries = read_queries(qfile)
-        assert queries["q1"].query_text == "What is\tAI and ML?"
+        assert queries["q1"] == "What is\tAI and ML?"
 
     def test_malformed_query_line_raises(self, tmp_path: Path):
         """Test that lines without exactly 2 columns raise an error."""
@@ -163,8 +163,8 @@ class TestReadDocuments:
         )
         docs = read_documents(dfile)
         assert len(docs) == 2
-        assert docs["d1"].doc == "Text 1"
-        assert docs["d2"].doc == "Text 2"
+        assert docs["d1"] == "Text 1"
+        assert docs["d2"] == "Text 2"
 
     def test_skip_empty_lines(self, tmp_path: Path):
         """Test that empty/whitespace lines are skipped."""